@@ -1,9 +1,36 @@
+import asyncio
+import concurrent.futures
+import os
+import queue
+import subprocess
+import threading
+import time
+from collections import namedtuple
 import tkinter as tk
 from tkinter import messagebox
 import chess
 import chess.engine
 from PIL import Image, ImageTk
 
+STOCKFISH_PATH = "stockfish/stockfish.exe"
+
+# Review mode keeps a full board every SNAPSHOT_INTERVAL plies and replays at
+# most SNAPSHOT_INTERVAL - 1 moves from the nearest one to rebuild any ply.
+SNAPSHOT_INTERVAL = 16
+EVAL_LIMIT = chess.engine.Limit(depth=14)
+EVAL_CLAMP = 1000
+MATE_SCORE = 10000
+EVAL_POLL_MS = 100
+
+ENGINE_TIMEOUT = 5.0
+ENGINE_SEARCH_BUDGET = 30.0
+ENGINE_QUIT_GRACE = 1.0
+ENGINE_MAX_ATTEMPTS = 3
+ENGINE_HEALTH_INTERVAL_MS = 30000
+ENGINE_RETRY_MS = 2000
+ENGINE_RETRY_MAX_MS = 60000
+ENGINE_FAILURES = (chess.engine.EngineError, asyncio.TimeoutError, concurrent.futures.TimeoutError, OSError)
+
 PIECE_VALUES = {
     "p": 1,
     "n": 3,
@@ -13,6 +40,289 @@ PIECE_VALUES = {
     "k": 0
 }
 
+ReviewFrame = namedtuple("ReviewFrame", ["piece_map", "last_move", "check_square"])
+
+
+class GameTimeline:
+    """Append-only record of a game for review: moves, SAN, periodic board
+    snapshots and a precomputed render frame for every ply."""
+
+    def __init__(self, interval=SNAPSHOT_INTERVAL):
+        self.interval = interval
+        self.moves = []
+        self.sans = []
+        self.snapshots = [chess.Board()]
+        self.frames = [self.make_frame(chess.Board(), None)]
+        self.tip = chess.Board()
+
+    def __len__(self):
+        return len(self.moves)
+
+    def make_frame(self, board, move):
+        check_square = board.king(board.turn) if board.is_check() else None
+        return ReviewFrame(board.piece_map(), move, check_square)
+
+    def push(self, move):
+        self.sans.append(self.tip.san(move))
+        self.tip.push(move)
+        self.moves.append(move)
+        if len(self.moves) % self.interval == 0:
+            self.snapshots.append(self.tip.copy(stack=False))
+        self.frames.append(self.make_frame(self.tip, move))
+
+    def board_at(self, ply):
+        base = ply - ply % self.interval
+        board = self.snapshots[base // self.interval].copy(stack=False)
+        for move in self.moves[base:ply]:
+            board.push(move)
+        return board
+
+
+def low_priority_popen_args():
+    if os.name == "nt":
+        return {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+    return {}
+
+
+def lower_priority(engine):
+    # preexec_fn is unsafe while other threads run, so renice after spawning instead.
+    if os.name != "nt":
+        os.setpriority(os.PRIO_PROCESS, engine.transport.get_pid(), 10)
+
+
+class EngineSupervisor:
+    """Keeps one warm engine process for the whole session. Crashed or hung
+    engines are respawned with their options restored and the interrupted
+    command is retried."""
+
+    def __init__(self, path=STOCKFISH_PATH, options=None, timeout=ENGINE_TIMEOUT,
+                 max_attempts=ENGINE_MAX_ATTEMPTS, search_budget=ENGINE_SEARCH_BUDGET, low_priority=False):
+        self.path = path
+        self.options = dict(options or {})
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.search_budget = search_budget
+        self.low_priority = low_priority
+        self.lock = threading.Lock()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.engine = None
+        self.game = object()
+        self.closed = False
+        self.started = False
+        self.restart_count = 0
+        self.failed_searches = 0
+        self.search_retries = 0
+        self.respawn_latencies = []
+
+    def spawn(self):
+        started = time.perf_counter()
+        popen_args = low_priority_popen_args() if self.low_priority else {}
+        engine = chess.engine.SimpleEngine.popen_uci(self.path, timeout=self.timeout, **popen_args)
+        try:
+            if self.low_priority:
+                lower_priority(engine)
+            if self.options:
+                engine.configure(self.options)
+        except ENGINE_FAILURES:
+            engine.close()
+            raise
+        self.engine = engine
+        return time.perf_counter() - started
+
+    def acquire(self):
+        # The first spawn also happens here, so an engine missing at launch goes through retry.
+        with self.lock:
+            if self.closed:
+                raise chess.engine.EngineTerminatedError("engine supervisor is shut down")
+            if self.engine is None:
+                latency = self.spawn()
+                if self.started:
+                    self.respawn_latencies.append(latency)
+                    self.restart_count += 1
+                self.started = True
+            return self.engine
+
+    def discard(self, engine):
+        # A failed engine is either dead or hung, so it is closed without waiting on quit.
+        with self.lock:
+            if self.engine is engine:
+                self.engine = None
+        engine.close()
+
+    def run_with_deadline(self, command, engine, deadline):
+        try:
+            future = self.executor.submit(command, engine)
+        except RuntimeError:
+            raise chess.engine.EngineTerminatedError("engine supervisor is shut down")
+        try:
+            return future.result(timeout=deadline)
+        except concurrent.futures.TimeoutError:
+            engine.close()
+            raise
+
+    def call(self, command, search=False, deadline=None):
+        error = None
+        for attempt in range(self.max_attempts):
+            engine = None
+            try:
+                engine = self.acquire()
+                if deadline is None:
+                    return command(engine)
+                return self.run_with_deadline(command, engine, deadline)
+            except ENGINE_FAILURES as e:
+                if self.closed:
+                    raise
+                error = e
+                if search and attempt + 1 < self.max_attempts:
+                    self.search_retries += 1
+                print(f"Engine failure ({e!r}), restarting (attempt {attempt + 1}/{self.max_attempts})")
+                if engine is not None:
+                    self.discard(engine)
+        if search:
+            self.failed_searches += 1
+        raise chess.engine.EngineError(f"engine failed {self.max_attempts} times: {error!r}")
+
+    def search_deadline(self, limit):
+        return self.timeout + (limit.time if limit.time is not None else self.search_budget)
+
+    def configure(self, options):
+        self.options.update(options)
+        self.call(lambda engine: engine.configure(options))
+
+    def new_game(self):
+        # python-chess sends ucinewgame whenever the game key passed to a search changes.
+        self.game = object()
+
+    def play(self, board, limit):
+        return self.call(lambda engine: engine.play(board, limit, game=self.game), search=True,
+                         deadline=self.search_deadline(limit))
+
+    def analyse(self, board, limit):
+        return self.call(lambda engine: engine.analyse(board, limit, game=self.game), search=True,
+                         deadline=self.search_deadline(limit))
+
+    def health_check(self):
+        try:
+            self.call(lambda engine: engine.ping())
+            return True
+        except ENGINE_FAILURES as e:
+            print(f"Engine health check failed: {e!r}")
+            return False
+
+    def stats(self):
+        latencies = self.respawn_latencies
+        return {
+            "restart_count": self.restart_count,
+            "failed_searches": self.failed_searches,
+            "search_retries": self.search_retries,
+            "last_respawn_latency": latencies[-1] if latencies else None,
+            "mean_respawn_latency": sum(latencies) / len(latencies) if latencies else None,
+        }
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            engine, self.engine = self.engine, None
+        if engine is not None:
+            # A hung engine only gets a short grace period before its process is killed.
+            engine.timeout = ENGINE_QUIT_GRACE
+            try:
+                engine.quit()
+            except ENGINE_FAILURES:
+                pass
+            finally:
+                engine.close()
+        self.executor.shutdown(wait=False)
+
+
+class EvaluationWorker(threading.Thread):
+    """Evaluates every ply of a timeline on its own low-priority engine,
+    always picking the unevaluated ply nearest to the current focus."""
+
+    def __init__(self, results, engine_path=STOCKFISH_PATH, limit=EVAL_LIMIT):
+        super().__init__(daemon=True)
+        self.results = results
+        self.engine_path = engine_path
+        self.limit = limit
+        self.condition = threading.Condition()
+        self.timeline = None
+        self.evaluated = set()
+        self.focus = 0
+        self.running = True
+        self.engine = None
+
+    def track(self, timeline):
+        with self.condition:
+            self.timeline = timeline
+            self.evaluated = set()
+            self.focus = 0
+            self.condition.notify()
+
+    def set_focus(self, ply):
+        with self.condition:
+            self.focus = ply
+            self.condition.notify()
+
+    def wake(self):
+        with self.condition:
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.engine is not None:
+            self.engine.shutdown()
+
+    def pause(self, seconds):
+        with self.condition:
+            if self.running:
+                self.condition.wait(seconds)
+
+    def next_ply(self):
+        if self.timeline is None:
+            return None
+        pending = [ply for ply in range(len(self.timeline.frames)) if ply not in self.evaluated]
+        if not pending:
+            return None
+        return min(pending, key=lambda ply: abs(ply - self.focus))
+
+    def run(self):
+        backoff = ENGINE_RETRY_MS / 1000
+        try:
+            while True:
+                with self.condition:
+                    ply = self.next_ply()
+                    while self.running and ply is None:
+                        self.condition.wait()
+                        ply = self.next_ply()
+                    if not self.running:
+                        break
+                    timeline = self.timeline
+                    board = timeline.board_at(ply)
+                try:
+                    if self.engine is None:
+                        self.engine = EngineSupervisor(self.engine_path, options={"Threads": 1},
+                                                       low_priority=True)
+                    info = self.engine.analyse(board, self.limit)
+                except ENGINE_FAILURES as e:
+                    if not self.running:
+                        break
+                    print(f"Evaluation of ply {ply} failed ({e!r}), retrying in {backoff:g} s")
+                    self.pause(backoff)
+                    backoff = min(backoff * 2, ENGINE_RETRY_MAX_MS / 1000)
+                    continue
+                backoff = ENGINE_RETRY_MS / 1000
+                score = info["score"].white().score(mate_score=MATE_SCORE)
+                with self.condition:
+                    if self.timeline is timeline:
+                        self.evaluated.add(ply)
+                        self.results.put((timeline, ply, score))
+        finally:
+            if self.engine is not None:
+                self.engine.shutdown()
+
+
 class ChessGUI:
     def __init__(self, root):
         self.root = root
@@ -38,8 +348,14 @@ class ChessGUI:
         self.captured_black_frame = tk.Frame(self.right_frame)
         self.captured_black_frame.grid(row=3, column=0, pady=(0, 5))
 
-        self.move_history = tk.Text(self.board_frame, height=10, width=15, state="disabled", font=("Courier", 10))
+        self.review_frame = tk.Frame(self.board_frame)
+        self.review_frame.grid(row=2, column=0, pady=(0, 5))
+
+        self.move_history = tk.Text(self.board_frame, height=10, width=15, state="disabled", font=("Courier", 10),
+                                    cursor="hand2")
         self.move_history.grid(row=3, column=0, padx=0)
+        self.move_history.tag_configure("current_ply", background="#FFFFCC")
+        self.move_history.bind("<Button-1>", self.on_history_click)
 
         self.restart_button = tk.Button(self.board_frame, text="Restart", command=self.restart_game, font=("Arial", 12))
         self.restart_button.grid(row=4, column=0, pady=10)
@@ -53,14 +369,47 @@ class ChessGUI:
                                 bg="saddlebrown", highlightthickness=0)
         self.canvas.grid(row=0, column=0)
 
+        self.eval_graph = tk.Canvas(self.review_frame, width=board_pixel_size + 2 * self.margin, height=60,
+                                    bg="gray20", highlightthickness=0)
+        self.eval_graph.grid(row=0, column=0)
+        self.eval_graph.bind("<Button-1>", self.on_eval_graph_click)
+        self.eval_graph.bind("<B1-Motion>", self.on_eval_graph_click)
+
+        self.review_scale = tk.Scale(self.review_frame, from_=0, to=0, orient=tk.HORIZONTAL,
+                                     length=board_pixel_size + 2 * self.margin, command=self.on_review_scale)
+        self.review_scale.grid(row=1, column=0)
+
         self.board_images = self.load_images()
+        self.piece_photos = {
+            name: ImageTk.PhotoImage(image.resize((self.square_size, self.square_size)))
+            for name, image in self.board_images.items()
+        }
         self.selected_square = None
         self.legal_destinations = []
         self.last_move = None
-        self.piece_images_on_canvas = {}
+
+        self.timeline = GameTimeline()
+        self.review_ply = None
+        self.pending_review_ply = None
+        self.evaluations = {}
+        self.eval_results = queue.Queue()
+        self.eval_worker = EvaluationWorker(self.eval_results)
+        self.eval_worker.track(self.timeline)
+        self.eval_worker.start()
 
         self.canvas.bind("<Button-1>", self.on_square_click)
         self.stockfish = self.init_stockfish()
+        # Engine commands for play run one at a time off the Tk thread.
+        self.engine_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.ai_job = None
+        self.ai_search = None
+        self.ai_failures = 0
+        self.last_engine_stats = None
+        self.engine_executor.submit(self.stockfish.health_check)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(ENGINE_HEALTH_INTERVAL_MS, self.check_engine)
+        self.draw_eval_graph()
+        self.root.after(EVAL_POLL_MS, self.poll_evaluations)
         self.draw_board()
 
         self.captured_white = []
@@ -81,14 +430,43 @@ class ChessGUI:
         return images
 
     def init_stockfish(self):
-        return chess.engine.SimpleEngine.popen_uci("stockfish/stockfish.exe")
+        return EngineSupervisor(STOCKFISH_PATH)
+
+    def check_engine(self):
+        self.engine_executor.submit(self.stockfish.health_check)
+        stats = self.engine_stats()
+        if stats != self.last_engine_stats:
+            print(f"Engine stats: {stats}")
+            self.last_engine_stats = stats
+        self.root.after(ENGINE_HEALTH_INTERVAL_MS, self.check_engine)
+
+    def engine_stats(self):
+        stats = {"play": self.stockfish.stats()}
+        if self.eval_worker.engine is not None:
+            stats["evaluation"] = self.eval_worker.engine.stats()
+        return stats
+
+    def on_close(self):
+        self.cancel_ai_turn()
+        self.eval_worker.stop()
+        self.stockfish.shutdown()
+        self.engine_executor.shutdown(wait=False)
+        print(f"Engine stats: {self.engine_stats()}")
+        self.root.destroy()
 
     def piece_type_to_name(self, piece_type, color):
         mapping = {1: 'p', 2: 'n', 3: 'b', 4: 'r', 5: 'q', 6: 'k'}
         return f"{'w' if color else 'b'}{mapping[piece_type]}"
 
+    def current_frame(self):
+        if self.review_ply is not None:
+            return self.timeline.frames[self.review_ply]
+        check_square = self.board.king(self.board.turn) if self.board.is_check() else None
+        return ReviewFrame(self.board.piece_map(), self.last_move, check_square)
+
     def draw_board(self):
         self.canvas.delete("all")
+        piece_map, last_move, check_square = self.current_frame()
         for row in range(8):
             for col in range(8):
                 x1 = col * self.square_size + self.margin
@@ -100,27 +478,22 @@ class ChessGUI:
                 color = "white" if (row + col) % 2 == 0 else "gray"
                 if self.selected_square is not None and square in self.legal_destinations:
                     color = "#ADD8E6"
-                elif self.last_move:
-                    if square == self.last_move.from_square:
+                elif last_move:
+                    if square == last_move.from_square:
                         color = "#FFFFCC"
-                    elif square == self.last_move.to_square:
+                    elif square == last_move.to_square:
                         color = "#CCFFCC"
 
-                if self.board.is_check():
-                    king_square = self.board.king(self.board.turn)
-                    if square == king_square:
-                        color = "#FF6666"
+                if square == check_square:
+                    color = "#FF6666"
 
                 self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="black")
 
-                piece = self.board.piece_at(square)
+                piece = piece_map.get(square)
                 if piece:
                     name = self.piece_type_to_name(piece.piece_type, piece.color)
-                    image = self.board_images.get(name)
-                    if image:
-                        img = image.resize((self.square_size, self.square_size))
-                        img_tk = ImageTk.PhotoImage(img)
-                        self.piece_images_on_canvas[square] = img_tk
+                    img_tk = self.piece_photos.get(name)
+                    if img_tk:
                         self.canvas.create_image(x1 + self.square_size // 2,
                                                  y1 + self.square_size // 2,
                                                  image=img_tk)
@@ -132,6 +505,13 @@ class ChessGUI:
         if not (0 <= col < 8 and 0 <= row < 8):
             return
 
+        if self.review_ply is not None:
+            self.exit_review()
+            return
+
+        if self.ai_job is not None or self.ai_search is not None:
+            return
+
         square = chess.square(col, 7 - row)
 
         if self.selected_square == square:
@@ -155,6 +535,7 @@ class ChessGUI:
                 if captured_piece:
                     self.record_capture(captured_piece)
                 self.board.push(move)
+                self.timeline.push(move)
                 self.selected_square = None
                 self.legal_destinations.clear()
                 self.animate_move(move)
@@ -166,7 +547,7 @@ class ChessGUI:
                 if self.board.is_game_over():
                     self.show_game_over()
                 else:
-                    self.root.after(500, self.ai_turn)
+                    self.ai_job = self.root.after(500, self.ai_turn)
             else:
                 self.selected_square = None
                 self.legal_destinations.clear()
@@ -174,17 +555,39 @@ class ChessGUI:
         self.draw_board()
 
     def ai_turn(self):
+        self.ai_job = None
         if self.board.is_game_over():
             self.show_game_over()
             return
 
-        result = self.stockfish.play(self.board, chess.engine.Limit(time=2.0))
+        self.ai_search = self.engine_executor.submit(self.stockfish.play, self.board.copy(),
+                                                     chess.engine.Limit(time=2.0))
+        self.ai_job = self.root.after(EVAL_POLL_MS, self.poll_ai_turn)
+
+    def poll_ai_turn(self):
+        self.ai_job = None
+        if not self.ai_search.done():
+            self.ai_job = self.root.after(EVAL_POLL_MS, self.poll_ai_turn)
+            return
+
+        search, self.ai_search = self.ai_search, None
+        try:
+            result = search.result()
+        except ENGINE_FAILURES as e:
+            delay = min(ENGINE_RETRY_MS * 2 ** self.ai_failures, ENGINE_RETRY_MAX_MS)
+            self.ai_failures += 1
+            print(f"Engine search failed ({e!r}), retrying in {delay} ms")
+            self.ai_job = self.root.after(delay, self.ai_turn)
+            return
+        self.ai_failures = 0
+
         move = result.move
         self.last_move = move
         captured_piece = self.board.piece_at(move.to_square)
         if captured_piece:
             self.record_capture(captured_piece)
         self.board.push(move)
+        self.timeline.push(move)
         self.selected_square = None
         self.legal_destinations.clear()
         self.animate_move(move)
@@ -196,6 +599,15 @@ class ChessGUI:
         if self.board.is_game_over():
             self.show_game_over()
 
+    def cancel_ai_turn(self):
+        if self.ai_job is not None:
+            self.root.after_cancel(self.ai_job)
+            self.ai_job = None
+        if self.ai_search is not None:
+            self.ai_search.cancel()
+            self.ai_search = None
+        self.ai_failures = 0
+
     def record_capture(self, captured_piece):
         piece_name = self.piece_type_to_name(captured_piece.piece_type, captured_piece.color)
         if captured_piece.color == chess.WHITE:
@@ -237,28 +649,33 @@ class ChessGUI:
         self.move_history.config(state="normal")
         self.move_history.delete(1.0, tk.END)
 
-        moves = list(self.board.move_stack)
-        temp_board = chess.Board()
+        sans = self.timeline.sans
 
-        for i in range(0, len(moves), 2):
-            white = temp_board.san(moves[i])
-            temp_board.push(moves[i])
-
-            if i + 1 < len(moves):
-                black = temp_board.san(moves[i + 1])
-                temp_board.push(moves[i + 1])
-            else:
-                black = ""
-
-            self.move_history.insert(tk.END, f"{(i // 2) + 1}. {white:6} {black:6}\n")
+        for i in range(0, len(sans), 2):
+            self.move_history.insert(tk.END, f"{(i // 2) + 1}. ")
+            self.move_history.insert(tk.END, f"{sans[i]:6}", f"ply{i + 1}")
+            self.move_history.insert(tk.END, " ")
+            if i + 1 < len(sans):
+                self.move_history.insert(tk.END, f"{sans[i + 1]:6}", f"ply{i + 2}")
+            self.move_history.insert(tk.END, "\n")
 
         self.move_history.see(tk.END)
         self.move_history.config(state="disabled")
+        self.review_scale.config(to=len(self.timeline))
+        if self.review_ply is None:
+            # A queued slider seek would be overwritten by the scale command.
+            if self.pending_review_ply is None:
+                self.review_scale.set(len(self.timeline))
+            self.eval_worker.set_focus(len(self.timeline))
+        else:
+            self.eval_worker.wake()
+        self.highlight_history_ply()
+        self.draw_eval_graph()
         self.check_captures()
 
     def animate_move(self, move, steps=5, delay=30):
         piece = self.board.piece_at(move.to_square)
-        if not piece:
+        if not piece or self.review_ply is not None:
             self.draw_board()
             return
 
@@ -271,16 +688,19 @@ class ChessGUI:
         dy = (to_row - from_row) * self.square_size / steps
 
         name = self.piece_type_to_name(piece.piece_type, piece.color)
-        image = self.board_images.get(name)
-        image = image.resize((self.square_size, self.square_size))
-        img_tk = ImageTk.PhotoImage(image)
+        img_tk = self.piece_photos.get(name)
+        if not img_tk:
+            self.draw_board()
+            return
 
         def step(i):
             self.draw_board()
+            # Seeking into review mid-animation shows a historical position; drop the overlay.
+            if self.review_ply is not None:
+                return
             x = from_col * self.square_size + dx * i + self.square_size // 2 + self.margin
             y = from_row * self.square_size + dy * i + self.square_size // 2 + self.margin
             self.canvas.create_image(x, y, image=img_tk)
-            self.canvas.image = img_tk
             if i < steps:
                 self.root.after(delay, step, i + 1)
             else:
@@ -288,16 +708,120 @@ class ChessGUI:
 
         step(0)
 
+    def seek(self, ply):
+        ply = max(0, min(ply, len(self.timeline)))
+        if ply == len(self.timeline):
+            ply = None
+        if ply == self.review_ply:
+            return
+        self.review_ply = ply
+        self.selected_square = None
+        self.legal_destinations.clear()
+        self.eval_worker.set_focus(len(self.timeline) if ply is None else ply)
+        self.review_scale.set(len(self.timeline) if ply is None else ply)
+        self.highlight_history_ply()
+        self.move_eval_cursor()
+        self.draw_board()
+
+    def request_seek(self, ply):
+        # Scrubbing fires far more events than frames; only the latest one is drawn.
+        if self.pending_review_ply is None:
+            self.root.after_idle(self.flush_seek)
+        self.pending_review_ply = ply
+
+    def flush_seek(self):
+        ply, self.pending_review_ply = self.pending_review_ply, None
+        if ply is not None:
+            self.seek(ply)
+
+    def exit_review(self):
+        self.seek(len(self.timeline))
+
+    def on_review_scale(self, value):
+        self.request_seek(int(float(value)))
+
+    def on_history_click(self, event):
+        index = self.move_history.index(f"@{event.x},{event.y}")
+        for tag in self.move_history.tag_names(index):
+            if tag.startswith("ply"):
+                self.request_seek(int(tag[3:]))
+                break
+        return "break"
+
+    def on_eval_graph_click(self, event):
+        width = int(self.eval_graph["width"])
+        plies = max(1, len(self.timeline))
+        self.request_seek(round(event.x / width * plies))
+
+    def highlight_history_ply(self):
+        self.move_history.tag_remove("current_ply", 1.0, tk.END)
+        if self.review_ply:
+            ranges = self.move_history.tag_ranges(f"ply{self.review_ply}")
+            if ranges:
+                self.move_history.tag_add("current_ply", *ranges)
+                self.move_history.see(ranges[0])
+
+    def poll_evaluations(self):
+        updated = False
+        while True:
+            try:
+                timeline, ply, score = self.eval_results.get_nowait()
+            except queue.Empty:
+                break
+            if timeline is self.timeline:
+                self.evaluations[ply] = score
+                updated = True
+        if updated:
+            self.draw_eval_graph()
+        self.root.after(EVAL_POLL_MS, self.poll_evaluations)
+
+    def eval_graph_x(self, ply):
+        width = int(self.eval_graph["width"])
+        return ply / max(1, len(self.timeline)) * width
+
+    def draw_eval_graph(self):
+        width = int(self.eval_graph["width"])
+        height = int(self.eval_graph["height"])
+        middle = height / 2
+        self.eval_graph.delete("all")
+        self.eval_graph.create_line(0, middle, width, middle, fill="gray50")
+
+        points = []
+        for ply in sorted(self.evaluations):
+            score = max(-EVAL_CLAMP, min(EVAL_CLAMP, self.evaluations[ply]))
+            points.extend((self.eval_graph_x(ply), middle - score / EVAL_CLAMP * (middle - 2)))
+        if len(points) >= 4:
+            self.eval_graph.create_line(*points, fill="white", width=2)
+
+        self.eval_graph.create_line(0, 0, 0, height, fill="#FFCC00", tags="cursor")
+        self.move_eval_cursor()
+
+    def move_eval_cursor(self):
+        ply = len(self.timeline) if self.review_ply is None else self.review_ply
+        x = self.eval_graph_x(ply)
+        self.eval_graph.coords("cursor", x, 0, x, int(self.eval_graph["height"]))
+
     def restart_game(self):
+        self.cancel_ai_turn()
+        self.stockfish.new_game()
+        self.engine_executor.submit(self.stockfish.health_check)
         self.board.reset()
         self.selected_square = None
         self.legal_destinations.clear()
         self.last_move = None
         self.captured_white = []
         self.captured_black = []
+        self.timeline = GameTimeline()
+        self.review_ply = None
+        self.pending_review_ply = None
+        self.evaluations = {}
+        self.eval_worker.track(self.timeline)
         self.move_history.config(state="normal")
         self.move_history.delete(1.0, tk.END)
         self.move_history.config(state="disabled")
+        self.review_scale.config(to=0)
+        self.review_scale.set(0)
+        self.draw_eval_graph()
         self.draw_board()
         self.update_captured_pieces(self.captured_white_frame, self.captured_white)
         self.update_captured_pieces(self.captured_black_frame, self.captured_black)